@@ -269,7 +269,7 @@ export interface ArtifactMetadata {
   created_at: string | null;
   promoted_to_permanent_at: string | null;
   execution_id: string;
-  file_exists: boolean;
+  file_exists: boolean | null;
   checkpoint_position: number | null;
   is_promoted: boolean;
 }
@@ -13,7 +13,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
+from src.core.write_queue import drain_writes
 from src.db.database import init_system_db, get_db
+from src.utils.logger import flush_logs
 import config
 
 # Import schemas for checkpoints
@@ -61,6 +63,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # Shutdown
     print("Shutting down Pipeline System...")
+    drain_writes()
+    flush_logs()
 
 
 # Create FastAPI application
@@ -34,6 +34,7 @@ router = APIRouter()
 )
 def get_artifact(
     artifact_id: str,
+    verify_file: bool = Query(False, description="Check the file on disk and report file_exists"),
     session: Session = Depends(get_db),
 ) -> ArtifactMetadata:
     """
@@ -41,8 +42,9 @@ def get_artifact(
 
     Returns information about an artifact including its file path,
     size, format, and whether it has been promoted to permanent storage.
+    File existence is only checked when verify_file is set.
     """
-    artifact = ArtifactService.get_artifact_metadata(session, artifact_id)
+    artifact = ArtifactService.get_artifact_metadata(session, artifact_id, verify_file=verify_file)
 
     if not artifact:
         raise HTTPException(
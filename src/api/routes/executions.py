@@ -128,11 +128,9 @@ def submit_form_data(
 
         # Get run status to determine if pipeline completed
         from src.db.models import PipelineRun
-        from sqlalchemy import select
 
-        run = session.execute(
-            select(PipelineRun).where(PipelineRun.run_id == execution.run_id)
-        ).scalar_one_or_none()
+        # Already in the session's identity map from the submit, so no query
+        run = session.get(PipelineRun, execution.run_id)
 
         response_data = {
             "execution_id": execution.execution_id,
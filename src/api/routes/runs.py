@@ -46,9 +46,14 @@ def create_run(
         run = RunService.create_run(session, pipeline_id, extends_from_run_id)
         session.commit()
 
-        # Get pipeline name for response
+        # Get pipeline name and checkpoint count for response; only those
+        # two columns are fetched
+        from sqlalchemy import select
         from src.db.models import Pipeline
-        pipeline = session.get(Pipeline, pipeline_id)
+        pipeline = session.execute(
+            select(Pipeline.pipeline_name, Pipeline.checkpoint_order)
+            .where(Pipeline.pipeline_id == pipeline_id)
+        ).one_or_none()
 
         response = PipelineRunResponse(
             run_id=run.run_id,
@@ -124,10 +129,17 @@ def list_runs(
 
     Returns runs ordered by version (newest first).
     """
+    offset = (page - 1) * page_size
     runs = RunService.list_runs_for_pipeline(
-        session, pipeline_id, limit=page_size, offset=(page - 1) * page_size
+        session, pipeline_id, limit=page_size, offset=offset
     )
-    total_count = RunService.count_runs_for_pipeline(session, pipeline_id)
+
+    # A partially filled page (or an empty first page) already gives the
+    # total, so only run the COUNT query when it can't be inferred
+    if 0 < len(runs) < page_size or (offset == 0 and not runs):
+        total_count = offset + len(runs)
+    else:
+        total_count = RunService.count_runs_for_pipeline(session, pipeline_id)
 
     from src.models.schemas import PipelineRunSummary
 
@@ -5,6 +5,7 @@ Handles all file system operations for the Pipeline system.
 Manages directories for pipelines, runs, temp workspaces, and archives.
 """
 
+import hashlib
 import json
 import shutil
 from datetime import datetime
@@ -14,6 +15,71 @@ from uuid import uuid4
 
 import config
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_default(value: object) -> str:
+    """Serialize values the JSON encoders don't handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# Stdlib fallback encoders, built once. ensure_ascii is off to match orjson,
+# which writes non-ASCII characters as UTF-8; every reader of these files must
+# therefore decode them as UTF-8 rather than with the locale's encoding.
+_json_encode_indent = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default).encode
+_json_encode_compact = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=_json_default).encode
+
+
+def encode_json(data: object, indent: bool = True) -> bytes:
+    """
+    Serialize data to JSON bytes.
+
+    Uses orjson when installed (datetimes are written natively in ISO 8601),
+    otherwise the stdlib encoder with the same output shape. Data orjson
+    can't encode, such as integers beyond 64 bits, also goes to the stdlib.
+
+    Args:
+        data: JSON-compatible data; datetimes and other values are stringified
+        indent: Indent with two spaces; otherwise emit compact JSON
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else None
+        try:
+            return orjson.dumps(data, default=_json_default, option=option)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. integers
+            # beyond 64 bits) before consulting default; retry with the stdlib
+            pass
+    if indent:
+        return _json_encode_indent(data).encode('utf-8')
+    return _json_encode_compact(data).encode('utf-8')
+
+
+def decode_json(data: str | bytes) -> object:
+    """
+    Parse a JSON document, using orjson when installed.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        The decoded value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class FileManager:
     """
@@ -209,8 +275,10 @@ class FileManager:
             execution_id: The execution UUID
         """
         exec_dir = self.get_temp_execution_directory(execution_id)
-        if exec_dir.exists():
+        try:
             shutil.rmtree(exec_dir)
+        except FileNotFoundError:
+            pass
 
     def get_artifact_staging_path(self, execution_id: str, artifact_name: str, artifact_id: str, artifact_format: str) -> Path:
         """
@@ -358,6 +426,45 @@ class FileManager:
             (latest_path).mkdir(parents=True, exist_ok=True)
             (latest_path / f"points_to_v{run_version}").touch()
 
+    def get_pipeline_definition_path(self) -> Path:
+        """
+        Get the path of the pipeline definition JSON file.
+
+        Returns:
+            Path: The pipeline definition file path
+        """
+        return self.definitions_dir / "pipeline.json"
+
+    def get_checkpoint_definition_path(self, checkpoint_id: str) -> Path:
+        """
+        Get the path of a checkpoint definition JSON file.
+
+        Args:
+            checkpoint_id: The checkpoint UUID
+
+        Returns:
+            Path: The checkpoint definition file path
+        """
+        return self.checkpoints_dir / f"{checkpoint_id}.json"
+
+    def save_json_batch(self, writes: list[tuple[Path, dict]], deletes: list[Path] = ()) -> None:
+        """
+        Write several JSON documents and remove files in a single call.
+
+        Lets a caller hand all file changes of one mutation to the background
+        writer as one operation. Writes are applied before deletes.
+
+        Args:
+            writes: (path, data) pairs to serialize and write
+            deletes: Paths to remove if they exist
+        """
+        for path, data in writes:
+            payload = encode_json(data)
+            with open(path, 'wb') as f:
+                f.write(payload)
+        for path in deletes:
+            path.unlink(missing_ok=True)
+
     def save_pipeline_definition(self, pipeline_data: dict) -> Path:
         """
         Save the pipeline definition to a JSON file.
@@ -368,9 +475,9 @@ class FileManager:
         Returns:
             Path: The saved file path
         """
-        definition_path = self.definitions_dir / "pipeline.json"
-        with open(definition_path, 'w') as f:
-            json.dump(pipeline_data, f, indent=2, default=str)
+        definition_path = self.get_pipeline_definition_path()
+        with open(definition_path, 'wb') as f:
+            f.write(encode_json(pipeline_data))
         return definition_path
 
     def load_pipeline_definition(self) -> dict:
@@ -384,7 +491,7 @@ class FileManager:
             FileNotFoundError: If the definition file doesn't exist
         """
         definition_path = self.definitions_dir / "pipeline.json"
-        with open(definition_path, 'r') as f:
+        with open(definition_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
     def save_checkpoint_definition(self, checkpoint_id: str, checkpoint_data: dict) -> Path:
@@ -398,9 +505,9 @@ class FileManager:
         Returns:
             Path: The saved file path
         """
-        definition_path = self.checkpoints_dir / f"{checkpoint_id}.json"
-        with open(definition_path, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2, default=str)
+        definition_path = self.get_checkpoint_definition_path(checkpoint_id)
+        with open(definition_path, 'wb') as f:
+            f.write(encode_json(checkpoint_data))
         return definition_path
 
     def load_checkpoint_definition(self, checkpoint_id: str) -> dict:
@@ -417,7 +524,7 @@ class FileManager:
             FileNotFoundError: If the definition file doesn't exist
         """
         definition_path = self.checkpoints_dir / f"{checkpoint_id}.json"
-        with open(definition_path, 'r') as f:
+        with open(definition_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
     def delete_checkpoint_definition(self, checkpoint_id: str) -> bool:
@@ -449,8 +556,8 @@ class FileManager:
         """
         run_dir = self.get_run_directory(run_version)
         info_path = run_dir / "run_info.json"
-        with open(info_path, 'w') as f:
-            json.dump(run_data, f, indent=2, default=str)
+        with open(info_path, 'wb') as f:
+            f.write(encode_json(run_data))
         return info_path
 
     def load_run_info(self, run_version: int) -> dict:
@@ -468,21 +575,22 @@ class FileManager:
         """
         run_dir = self.get_run_directory(run_version)
         info_path = run_dir / "run_info.json"
-        with open(info_path, 'r') as f:
+        with open(info_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
     def get_file_checksum(self, file_path: Path) -> str:
         """
         Calculate SHA-256 checksum of a file.
 
+        The file is hashed on every call; artifact metadata reads the checksum
+        stored on the artifact row instead.
+
         Args:
             file_path: Path to the file
 
         Returns:
             str: Hexadecimal checksum string
         """
-        import hashlib
-
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
             for byte_block in iter(lambda: f.read(4096), b""):
@@ -502,5 +610,26 @@ class FileManager:
         return file_path.stat().st_size
 
 
+_file_managers = {}  # Cache of file managers per pipeline_id
+
+
+def get_file_manager(pipeline_id: str) -> FileManager:
+    """
+    Get or create a FileManager for a pipeline.
+
+    FileManager only holds paths derived from the pipeline ID, so one
+    instance per pipeline is shared instead of rebuilding them per request.
+
+    Args:
+        pipeline_id: The pipeline UUID
+
+    Returns:
+        FileManager instance for the pipeline
+    """
+    if pipeline_id not in _file_managers:
+        _file_managers[pipeline_id] = FileManager(pipeline_id)
+    return _file_managers[pipeline_id]
+
+
 # Import os for Windows symlink detection
 import os
@@ -0,0 +1,91 @@
+"""
+Background Write Queue
+
+Runs file system side effects (definition snapshots, log appends) on a single
+daemon thread so request handlers don't wait on disk I/O.
+
+Operations run in submission order. The database stays the source of truth,
+so when the queue is full the oldest pending write is dropped to make room.
+"""
+
+import logging
+import queue
+import threading
+import traceback
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of pending operations before the oldest is dropped
+WRITE_QUEUE_MAXSIZE = 4096
+
+_write_queue: "queue.Queue[Callable[[], object]]" = queue.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def _writer_loop() -> None:
+    """Execute queued operations forever."""
+    while True:
+        op = _write_queue.get()
+        try:
+            op()
+        except Exception:
+            # A failed write must not kill the writer thread
+            traceback.print_exc()
+        finally:
+            _write_queue.task_done()
+
+
+def _ensure_writer() -> None:
+    """Start the writer thread on first use."""
+    global _writer_thread
+
+    if _writer_thread is None:
+        with _writer_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(
+                    target=_writer_loop,
+                    name="pipeline-write-queue",
+                    daemon=True,
+                )
+                _writer_thread.start()
+
+
+def enqueue_write(op: Callable[[], object]) -> None:
+    """
+    Schedule a file system operation on the background writer.
+
+    Any data the operation needs from ORM objects must be snapshotted by the
+    caller (e.g. via to_dict()) before enqueueing.
+
+    Args:
+        op: Zero-argument callable performing the write
+    """
+    _ensure_writer()
+    while True:
+        try:
+            _write_queue.put_nowait(op)
+            return
+        except queue.Full:
+            # Drop the oldest pending write to make room
+            try:
+                dropped = _write_queue.get_nowait()
+                _write_queue.task_done()
+            except queue.Empty:
+                continue
+            logger.warning(
+                "Write queue full (%d pending); dropped oldest write %r",
+                WRITE_QUEUE_MAXSIZE,
+                dropped,
+            )
+
+
+def drain_writes() -> None:
+    """
+    Block until every queued operation has been executed.
+
+    Called on application shutdown so pending writes are not lost.
+    """
+    if _writer_thread is not None:
+        _write_queue.join()
@@ -9,13 +9,18 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Iterator
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, inspect, Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 import config
 from src.db.models import Base
 
 
+# Indexes superseded by a differently named replacement in the models; they
+# are dropped from existing databases once the replacement exists
+_RETIRED_INDEXES = ("idx_pipeline_run_version",)
+
+
 # Global engine and session maker
 _engine: Engine | None = None
 _session_maker: sessionmaker | None = None
@@ -72,10 +77,33 @@ def get_session_maker() -> sessionmaker:
 def init_system_db() -> None:
     """
     Initialize the system database by creating all tables.
+
+    Nullable columns and indexes added to existing tables are created as
+    well, since create_all skips tables that already exist, and retired
+    indexes are dropped.
     """
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
 
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    conn.exec_driver_sql(
+                        f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                    )
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        for index_name in _RETIRED_INDEXES:
+            conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{index_name}"')
+
 
 def get_session() -> Session:
     """
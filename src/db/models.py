@@ -6,6 +6,7 @@ This is the source of truth for all pipeline state.
 """
 
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from uuid import UUID, uuid4
 
@@ -21,6 +22,7 @@ from sqlalchemy import (
     String,
     Text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -78,6 +80,24 @@ class Pipeline(Base):
         return f"<Pipeline(pipeline_id={self.pipeline_id}, name={self.pipeline_name}, version={self.pipeline_definition_version})>"
 
 
+# Columns written to checkpoint definition files, fetched with one attrgetter call
+_CHECKPOINT_DICT_KEYS = (
+    "checkpoint_id",
+    "pipeline_id",
+    "checkpoint_name",
+    "checkpoint_description",
+    "dependencies",
+    "inputs",
+    "execution",
+    "human_interaction",
+    "output",
+    "instructions",
+    "created_at",
+    "updated_at",
+)
+_checkpoint_dict_getter = attrgetter(*_CHECKPOINT_DICT_KEYS)
+
+
 # =============================================================================
 # Checkpoint Definition Model
 # =============================================================================
@@ -111,9 +131,26 @@ class CheckpointDefinition(Base):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Serves the per-pipeline listing ordered by created_at without a
+        # sort. On PostgreSQL the id, name and updated_at columns ride in the
+        # index; description and the execution JSON are still read from the
+        # table, so this is not an index-only scan.
+        Index(
+            "idx_checkpoint_pipeline_created",
+            "pipeline_id",
+            "created_at",
+            postgresql_include=["checkpoint_id", "checkpoint_name", "updated_at"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<CheckpointDefinition(checkpoint_id={self.checkpoint_id}, name={self.checkpoint_name})>"
 
+    def to_dict(self) -> dict:
+        """Convert checkpoint definition model to dictionary."""
+        return dict(zip(_CHECKPOINT_DICT_KEYS, _checkpoint_dict_getter(self)))
+
 
 # =============================================================================
 # Pipeline Run Model
@@ -170,7 +207,11 @@ class PipelineRun(Base):
     previous_run = relationship("PipelineRun", foreign_keys=[previous_run_id], remote_side=[run_id])
 
     __table_args__ = (
-        Index("idx_pipeline_run_version", "pipeline_id", "run_version"),
+        # Serves latest-run (ORDER BY run_version DESC LIMIT 1), run listing
+        # and MAX(run_version) by seeking on pipeline_id and scanning backwards.
+        # Unique so concurrent creates can't claim the same version; it
+        # replaces the non-unique idx_pipeline_run_version (see init_system_db)
+        Index("idx_pipeline_run_version_unique", "pipeline_id", "run_version", unique=True),
         Index("idx_pipeline_run_status", "pipeline_id", "status"),
     )
 
@@ -311,12 +352,20 @@ class HumanInteraction(Base):
     )
     user_input: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     system_response: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Structured form submission (script_input), decoded by the driver on read.
+    # Stored as JSONB on PostgreSQL so form fields can be queried server-side.
+    form_data: Mapped[Optional[dict]] = mapped_column(
+        SQLiteJSON().with_variant(JSONB(), "postgresql"), nullable=True
+    )
 
     # Relationships
     checkpoint_execution = relationship("CheckpointExecution", back_populates="human_interactions")
 
     __table_args__ = (
         Index("idx_interaction_execution_timestamp", "execution_id", "timestamp"),
+        # Serves the latest form submission lookup (ORDER BY timestamp DESC
+        # LIMIT 1) by scanning the index backwards, so no DESC key is needed
+        Index("idx_interaction_execution_type_timestamp", "execution_id", "interaction_type", "timestamp"),
     )
 
     def __repr__(self) -> str:
@@ -350,7 +399,13 @@ class Artifact(Base):
     checkpoint_execution = relationship("CheckpointExecution", back_populates="artifacts")
 
     __table_args__ = (
-        Index("idx_artifact_execution", "execution_id"),
+        # Covering index for per-execution artifact listings; INCLUDE is
+        # honoured on PostgreSQL and ignored by other dialects.
+        Index(
+            "idx_artifact_execution",
+            "execution_id",
+            postgresql_include=["artifact_id", "file_path", "format", "promoted_to_permanent_at"],
+        ),
         Index("idx_artifact_id_name", "artifact_id", "artifact_name"),
     )
 
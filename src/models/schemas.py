@@ -453,7 +453,7 @@ class ArtifactMetadata(BaseModel):
     created_at: Optional[datetime] = Field(None, description="Creation timestamp")
     promoted_to_permanent_at: Optional[datetime] = Field(None, description="Promotion timestamp")
     execution_id: str = Field(..., description="Execution ID that created this artifact")
-    file_exists: bool = Field(..., description="Whether file still exists on disk")
+    file_exists: Optional[bool] = Field(None, description="Whether file still exists on disk (None unless verified)")
     checkpoint_position: Optional[int] = Field(None, description="Checkpoint position")
     is_promoted: bool = Field(..., description="Whether artifact has been promoted to permanent storage")
 
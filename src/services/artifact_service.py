@@ -3,9 +3,14 @@ Artifact Service
 
 Business logic for artifact management.
 Handles retrieving artifact metadata, content, and file paths for download/preview.
+
+Lookups by execution rely on the indexes declared in src/db/models.py:
+idx_execution_run_position (run_id, checkpoint_position) on checkpoint_executions
+and idx_artifact_execution (execution_id, covering on PostgreSQL) on artifacts.
 """
 
-import json
+import codecs
+import mmap
 import os
 from pathlib import Path
 from typing import Optional
@@ -13,8 +18,11 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.core.file_manager import FileManager
-from src.db.models import Artifact, CheckpointExecution, CheckpointDefinition, PipelineRun
+from src.db.models import Artifact, CheckpointExecution, PipelineRun
+
+
+# Formats whose content can be previewed as text
+_TEXT_FORMATS = frozenset({"json", "md", "txt", "py", "html", "csv", "mmd"})
 
 
 class ArtifactService:
@@ -42,37 +50,40 @@ class ArtifactService:
         ).scalar_one_or_none()
 
     @staticmethod
-    def get_artifact_metadata(session: Session, artifact_id: str) -> Optional[dict]:
+    def get_artifact_metadata(session: Session, artifact_id: str, verify_file: bool = False) -> Optional[dict]:
         """
         Get artifact metadata including file information.
 
+        The stored size_bytes and checksum are authoritative, so the file
+        system is only touched when verify_file is set and the file is never
+        re-hashed here.
+
         Args:
             session: Database session
             artifact_id: Artifact ID
+            verify_file: Stat the file to report file_exists and its current size
 
         Returns:
-            Dictionary with artifact metadata or None
+            Dictionary with artifact metadata or None (file_exists is None when not verified)
         """
         artifact = ArtifactService.get_artifact(session, artifact_id)
         if not artifact:
             return None
 
         # Get checkpoint execution for additional context
-        execution = session.execute(
-            select(CheckpointExecution).where(
-                CheckpointExecution.execution_id == artifact.execution_id
-            )
-        ).scalar_one_or_none()
+        execution = session.get(CheckpointExecution, artifact.execution_id)
 
-        # Get file size from actual file if exists
         file_size = artifact.size_bytes
-        file_exists = False
-        if artifact.file_path:
-            file_path = Path(artifact.file_path)
-            if file_path.exists():
-                file_exists = True
-                # Update file size from actual file
-                file_size = file_path.stat().st_size
+        file_exists = None
+        if verify_file:
+            file_exists = False
+            if artifact.file_path:
+                # A single stat both confirms the file exists and gives its size
+                try:
+                    file_size = os.stat(artifact.file_path).st_size
+                    file_exists = True
+                except FileNotFoundError:
+                    pass
 
         return {
             "artifact_id": artifact.artifact_id,
@@ -122,12 +133,11 @@ class ArtifactService:
                 "file_path": str(file_path),
             }
 
-        # Binary formats - don't return content
-        binary_formats = []  # For now, treat all as text-based for preview
-
         # Check file size limit for preview (1MB)
         file_size = file_path.stat().st_size
         max_preview_size = 1024 * 1024  # 1MB
+        mmap_threshold = 64 * 1024  # 64KB
+        binary_probe_size = 4096
 
         if file_size > max_preview_size:
             return {
@@ -137,16 +147,34 @@ class ArtifactService:
                 "size_bytes": file_size,
                 "error": "File too large for preview",
                 "file_path": str(file_path),
-                "content_type": "text" if artifact.format in ["json", "md", "txt", "py", "html", "csv", "mmd"] else "binary",
+                "content_type": "text" if artifact.format in _TEXT_FORMATS else "binary",
             }
 
         # Read file content for text formats
-        text_formats = ["json", "md", "txt", "py", "html", "csv", "mmd"]
-
-        if artifact.format in text_formats:
+        if artifact.format in _TEXT_FORMATS:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                with open(file_path, 'rb') as f:
+                    # Decode a small probe first so binary files are rejected
+                    # without reading the rest. The incremental decoder tolerates
+                    # a multi-byte character split at the probe boundary.
+                    probe = f.read(binary_probe_size)
+                    codecs.getincrementaldecoder('utf-8')().decode(probe)
+
+                    mm = None
+                    if file_size > mmap_threshold:
+                        # Map mid-sized files instead of reading them into a fresh buffer
+                        try:
+                            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        except (ValueError, OSError):
+                            # The file changed since the stat (e.g. truncated to
+                            # 0 bytes, which can't be mapped); read it normally
+                            pass
+
+                    if mm is not None:
+                        with mm:
+                            content = str(mm, 'utf-8')
+                    else:
+                        content = (probe + f.read()).decode('utf-8')
 
                 return {
                     "artifact_id": artifact.artifact_id,
@@ -188,11 +216,12 @@ class ArtifactService:
         Returns:
             List of artifact metadata dictionaries
         """
+        # Stream rows in batches rather than materializing every ORM object up front
         artifacts = session.execute(
             select(Artifact).where(
                 Artifact.execution_id == execution_id
             ).order_by(Artifact.created_at)
-        ).scalars().all()
+        ).scalars().yield_per(500)
 
         return [
             {
@@ -249,65 +278,77 @@ class ArtifactService:
         if not previous_run_id:
             return []
 
-        # Get the previous run
-        previous_run = session.execute(
-            select(PipelineRun).where(PipelineRun.run_id == previous_run_id)
-        ).scalar_one_or_none()
+        return ArtifactService.get_previous_version_artifacts_bulk(
+            session, previous_run_id, [checkpoint_position]
+        ).get(checkpoint_position, [])
 
-        if not previous_run:
-            return []
+    @staticmethod
+    def get_previous_version_artifacts_bulk(
+        session: Session,
+        previous_run_id: str,
+        positions: list[int]
+    ) -> dict[int, list[dict]]:
+        """
+        Get promoted artifacts from several checkpoint positions of a previous run.
 
-        # Get the checkpoint execution from the previous run at the same position
-        previous_execution = session.execute(
-            select(CheckpointExecution)
-            .where(
-                CheckpointExecution.run_id == previous_run_id,
-                CheckpointExecution.checkpoint_position == checkpoint_position
-            )
-        ).scalar_one_or_none()
+        Fetches every position in one joined query instead of one round trip
+        per position.
 
-        if not previous_execution:
-            return []
+        Args:
+            session: Database session
+            previous_run_id: The previous run's ID to get artifacts from
+            positions: Checkpoint positions to collect artifacts for
 
-        # Get all artifacts for that execution
-        artifacts = session.execute(
-            select(Artifact).where(
-                Artifact.execution_id == previous_execution.execution_id
-            )
-        ).scalars().all()
+        Returns:
+            Mapping of checkpoint position to its artifact dictionaries;
+            positions without artifacts are omitted
+        """
+        if not previous_run_id or not positions:
+            return {}
 
-        # Filter to only promoted artifacts (permanent storage)
-        result = []
-        for art in artifacts:
-            if not art.promoted_to_permanent_at:
-                continue  # Skip non-promoted artifacts
+        rows = session.execute(
+            select(Artifact, CheckpointExecution.checkpoint_position, PipelineRun.run_version)
+            .join(CheckpointExecution, CheckpointExecution.execution_id == Artifact.execution_id)
+            .join(PipelineRun, PipelineRun.run_id == CheckpointExecution.run_id)
+            .where(
+                CheckpointExecution.run_id == previous_run_id,
+                CheckpointExecution.checkpoint_position.in_(positions),
+                # Only promoted artifacts (permanent storage)
+                Artifact.promoted_to_permanent_at.is_not(None),
+            )
+            .order_by(CheckpointExecution.checkpoint_position, Artifact.created_at)
+        ).all()
 
-            file_path = Path(art.file_path)
-            if not file_path.exists():
+        result: dict[int, list[dict]] = {}
+        for art, position, run_version in rows:
+            # A single stat covers both the existence check and the size check
+            file_path = art.file_path
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
                 continue  # Skip missing files
 
             # Try to read content for text-based formats (for UI display)
             content = None
-            text_formats = ["json", "md", "txt", "py", "html", "csv", "mmd"]
-            if art.format in text_formats:
+            if art.format in _TEXT_FORMATS:
                 try:
                     # Only read small files for context display
-                    if file_path.stat().st_size <= 10000:  # 10KB limit for inline display
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                    if file_size <= 10000:  # 10KB limit for inline display
+                        with open(file_path, 'rb') as f:
+                            content = f.read().decode('utf-8')
                 except Exception:
                     pass  # Content not critical, metadata is enough
 
-            result.append({
+            result.setdefault(position, []).append({
                 "artifact_id": art.artifact_id,
                 "artifact_name": art.artifact_name,
                 "format": art.format,
-                "file_path": str(file_path),
+                "file_path": file_path,
                 "size_bytes": art.size_bytes,
                 "created_at": art.created_at.isoformat() if art.created_at else None,
                 "content": content,
                 "is_from_previous": True,
-                "previous_run_version": previous_run.run_version,
+                "previous_run_version": run_version,
             })
 
         return result
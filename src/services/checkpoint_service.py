@@ -4,14 +4,20 @@ Checkpoint Service
 Business logic for checkpoint CRUD operations.
 """
 
-from typing import Optional
-from uuid import uuid4
-
-from sqlalchemy import select
+import copy
+import os
+from datetime import datetime
+from functools import partial
+from typing import Mapping, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, String, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
 
-from src.core.file_manager import FileManager
+from src.core.file_manager import get_file_manager
+from src.core.write_queue import enqueue_write
 from src.db.models import CheckpointDefinition, Event, Pipeline
 from src.models.schemas import (
     CheckpointCreate,
@@ -27,6 +33,111 @@ from src.models.schemas import (
 from src.utils.logger import get_logger
 
 
+def _batch_uuids(n: int) -> list[str]:
+    """
+    Generate n random (version 4) UUIDs from a single os.urandom call.
+
+    IDs are opaque, so the 32-character hex form is used rather than the
+    hyphenated one.
+
+    Args:
+        n: Number of UUIDs to generate
+
+    Returns:
+        list of UUID hex strings
+    """
+    raw = os.urandom(16 * n)
+    return [UUID(bytes=raw[i * 16:(i + 1) * 16], version=4).hex for i in range(n)]
+
+
+def _append_to_checkpoint_order(
+    session: Session,
+    pipeline: Pipeline,
+    checkpoint_id: str,
+    now: datetime,
+) -> None:
+    """
+    Append a checkpoint ID to a pipeline's checkpoint_order server-side.
+
+    Issues a single UPDATE ... RETURNING that appends in the database
+    (json_insert on SQLite, jsonb || on PostgreSQL) instead of rewriting the
+    whole list from Python, then syncs the returned values onto the loaded
+    pipeline without marking it dirty.
+
+    Args:
+        session: Database session
+        pipeline: Loaded pipeline to append to
+        checkpoint_id: Checkpoint UUID to append
+        now: Timestamp to store as the pipeline's updated_at
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        appended = cast(
+            func.coalesce(cast(Pipeline.checkpoint_order, JSONB), cast(literal("[]"), JSONB))
+            .op("||")(func.jsonb_build_array(checkpoint_id)),
+            JSON,
+        )
+    else:
+        appended = func.json_insert(
+            func.coalesce(Pipeline.checkpoint_order, literal("[]", String)), "$[#]", checkpoint_id
+        )
+
+    checkpoint_order, updated_at = session.execute(
+        update(Pipeline)
+        .where(Pipeline.pipeline_id == pipeline.pipeline_id)
+        .values(checkpoint_order=appended, updated_at=now)
+        .returning(Pipeline.checkpoint_order, Pipeline.updated_at)
+        .execution_options(synchronize_session=False)
+    ).one()
+
+    set_committed_value(pipeline, "checkpoint_order", checkpoint_order)
+    set_committed_value(pipeline, "updated_at", updated_at)
+
+
+# Constant subtrees of a new checkpoint definition (Slice 4). Each checkpoint
+# gets its own deep copy, so an in-place change to one checkpoint's JSON column
+# can't leak into these defaults or into later checkpoints.
+_DEFAULT_DEPENDENCIES = {
+    "required_checkpoint_ids": [],  # Empty for Slice 4
+}
+_DEFAULT_INPUTS = {
+    "include_previous_version": False,  # Default for Slice 4
+    "include_checkpoint_outputs": [],  # Empty for Slice 4
+}
+_DEFAULT_OUTPUT_VALIDATION = {
+    "enabled": False,  # No validation in Slice 4
+}
+_DEFAULT_INSTRUCTIONS = {
+    "system_prompt": None,
+    "task_prompt": None,
+    "examples": [],
+    "injection_points": {
+        "previous_version_context": "before_task_prompt",
+        "checkpoint_references": "before_task_prompt",
+    },
+    "injection_format": {
+        "include_file_paths": True,
+        "include_file_contents": True,
+        "content_format": "markdown",
+    },
+}
+
+# Fallback values for keys missing from stored input field / output artifact
+# definitions, merged under each entry when building responses
+_INPUT_FIELD_DEFAULTS = {
+    "name": "",
+    "type": "text",
+    "label": "",
+    "required": True,
+    "default": None,
+    "validation": None,
+}
+_OUTPUT_ARTIFACT_DEFAULTS = {
+    "name": "",
+    "format": "json",
+    "description": None,
+}
+
+
 class CheckpointService:
     """
     Service for managing checkpoint CRUD operations.
@@ -60,31 +171,21 @@ class CheckpointService:
         if not pipeline:
             raise ValueError(f"Pipeline with ID '{pipeline_id}' not found")
 
-        # Generate checkpoint ID
-        checkpoint_id = str(uuid4())
+        # Generate the checkpoint ID plus one ID per input field and output artifact
+        input_fields = data.human_only_config.input_fields
+        ids = iter(_batch_uuids(1 + len(input_fields) + len(data.output_artifacts)))
+        checkpoint_id = next(ids)
 
         # Generate IDs for input fields and output artifacts
-        input_fields_with_ids = []
-        for field in data.human_only_config.input_fields:
-            input_fields_with_ids.append({
-                "field_id": str(uuid4()),
-                "name": field.name,
-                "type": field.type,
-                "label": field.label,
-                "required": field.required,
-                "default": field.default,
-                "validation": field.validation,
-            })
-
-        output_artifacts_with_ids = []
-        for artifact in data.output_artifacts:
-            output_artifacts_with_ids.append({
-                "artifact_id": str(uuid4()),
-                "name": artifact.name,
-                "format": artifact.format,
-                "description": artifact.description,
-                "schema": None,  # No schema in Slice 4
-            })
+        # (the shared ids iterator goes last in zip so no extra ID is consumed)
+        input_fields_with_ids = [
+            {"field_id": field_id, **field.model_dump()}
+            for field, field_id in zip(input_fields, ids)
+        ]
+        output_artifacts_with_ids = [
+            {"artifact_id": artifact_id, **artifact.model_dump(), "schema": None}  # No schema in Slice 4
+            for artifact, artifact_id in zip(data.output_artifacts, ids)
+        ]
 
         # Build the checkpoint definition JSON structure
         # For Slice 4, we only support human_only mode
@@ -99,19 +200,18 @@ class CheckpointService:
             },
         }
 
+        # Timestamps are set here rather than by column defaults so the
+        # definition snapshot below has them without a flush
+        now = datetime.utcnow()
+
         # Create checkpoint model
         checkpoint = CheckpointDefinition(
             checkpoint_id=checkpoint_id,
             pipeline_id=pipeline_id,
             checkpoint_name=data.checkpoint_name,
             checkpoint_description=data.checkpoint_description,
-            dependencies={
-                "required_checkpoint_ids": [],  # Empty for Slice 4
-            },
-            inputs={
-                "include_previous_version": False,  # Default for Slice 4
-                "include_checkpoint_outputs": [],  # Empty for Slice 4
-            },
+            dependencies=copy.deepcopy(_DEFAULT_DEPENDENCIES),
+            inputs=copy.deepcopy(_DEFAULT_INPUTS),
             execution=execution_config,
             human_interaction={
                 "requires_approval_to_start": data.human_interaction.requires_approval_to_start,
@@ -120,43 +220,25 @@ class CheckpointService:
             },
             output={
                 "artifacts": output_artifacts_with_ids,
-                "validation": {
-                    "enabled": False,  # No validation in Slice 4
-                },
-            },
-            instructions={
-                "system_prompt": None,
-                "task_prompt": None,
-                "examples": [],
-                "injection_points": {
-                    "previous_version_context": "before_task_prompt",
-                    "checkpoint_references": "before_task_prompt",
-                },
-                "injection_format": {
-                    "include_file_paths": True,
-                    "include_file_contents": True,
-                    "content_format": "markdown",
-                },
+                "validation": copy.deepcopy(_DEFAULT_OUTPUT_VALIDATION),
             },
+            instructions=copy.deepcopy(_DEFAULT_INSTRUCTIONS),
+            created_at=now,
+            updated_at=now,
         )
 
-        session.add(checkpoint)
-        session.flush()
-
-        # Update pipeline's checkpoint_order
-        checkpoint_order = pipeline.checkpoint_order or []
-        if not isinstance(checkpoint_order, list):
-            checkpoint_order = []
-        checkpoint_order.append(checkpoint_id)
-        pipeline.checkpoint_order = checkpoint_order
-        flag_modified(pipeline, "checkpoint_order")  # Mark JSON column as modified
+        # Append to pipeline's checkpoint_order in the database
+        _append_to_checkpoint_order(session, pipeline, checkpoint_id, now)
 
-        # Save checkpoint definition to file system
-        file_manager = FileManager(pipeline_id)
-        file_manager.save_checkpoint_definition(checkpoint_id, checkpoint.to_dict())
-
-        # Update pipeline definition file
-        file_manager.save_pipeline_definition(pipeline.to_dict())
+        # Save checkpoint and pipeline definitions to file system in one
+        # background operation (snapshotted now, written by the writer thread).
+        # The checkpoint snapshot is also reused to build the response.
+        checkpoint_dict = checkpoint.to_dict()
+        file_manager = get_file_manager(pipeline_id)
+        enqueue_write(partial(file_manager.save_json_batch, [
+            (file_manager.get_checkpoint_definition_path(checkpoint_id), checkpoint_dict),
+            (file_manager.get_pipeline_definition_path(), pipeline.to_dict()),
+        ]))
 
         # Log event
         event = Event(
@@ -169,10 +251,10 @@ class CheckpointService:
                 "execution_mode": data.execution_mode,
             }
         )
-        session.add(event)
 
+        # Checkpoint and event go out in the same flush as part of the commit
+        session.add_all([checkpoint, event])
         session.commit()
-        session.refresh(checkpoint)
 
         # Log to system.log
         logger = get_logger(pipeline_id)
@@ -187,7 +269,7 @@ class CheckpointService:
         )
 
         # Build response
-        return CheckpointService._build_checkpoint_response(checkpoint)
+        return CheckpointService._build_checkpoint_response(checkpoint, cached_dict=checkpoint_dict)
 
     @staticmethod
     def get_checkpoint(
@@ -204,14 +286,17 @@ class CheckpointService:
         Returns:
             CheckpointResponse: Checkpoint data or None if not found
         """
-        checkpoint = session.execute(
-            select(CheckpointDefinition).where(CheckpointDefinition.checkpoint_id == checkpoint_id)
-        ).scalar_one_or_none()
-
-        if not checkpoint:
+        # Plain row fetch; the response is built from the row mapping without
+        # loading an ORM instance into the identity map
+        checkpoints = CheckpointDefinition.__table__
+        row = session.execute(
+            select(checkpoints).where(checkpoints.c.checkpoint_id == checkpoint_id)
+        ).first()
+
+        if not row:
             return None
 
-        return CheckpointService._build_checkpoint_response(checkpoint)
+        return CheckpointService._build_checkpoint_response(None, cached_dict=row._mapping)
 
     @staticmethod
     def get_checkpoints_for_pipeline(
@@ -228,87 +313,91 @@ class CheckpointService:
         Returns:
             list of checkpoint summaries
         """
-        checkpoints = session.execute(
-            select(CheckpointDefinition)
+        # Project only the summary columns; the mode is extracted from the
+        # execution JSON in the database so the full blobs are never loaded
+        rows = session.execute(
+            select(
+                CheckpointDefinition.checkpoint_id,
+                CheckpointDefinition.checkpoint_name,
+                CheckpointDefinition.checkpoint_description,
+                func.coalesce(
+                    CheckpointDefinition.execution["mode"].as_string(), "unknown"
+                ).label("execution_mode"),
+                CheckpointDefinition.created_at,
+                CheckpointDefinition.updated_at,
+            )
             .where(CheckpointDefinition.pipeline_id == pipeline_id)
             .order_by(CheckpointDefinition.created_at)
-        ).scalars().all()
-
-        return [
-            CheckpointSummary(
-                checkpoint_id=cp.checkpoint_id,
-                checkpoint_name=cp.checkpoint_name,
-                checkpoint_description=cp.checkpoint_description,
-                execution_mode=cp.execution.get("mode", "unknown") if cp.execution else "unknown",
-                created_at=cp.created_at,
-                updated_at=cp.updated_at,
-            )
-            for cp in checkpoints
-        ]
+        ).all()
+
+        return [CheckpointSummary.model_construct(**row._mapping) for row in rows]
 
     @staticmethod
-    def _build_checkpoint_response(checkpoint: CheckpointDefinition) -> CheckpointResponse:
+    def _build_checkpoint_response(
+        checkpoint: Optional[CheckpointDefinition],
+        cached_dict: Optional[Mapping] = None,
+    ) -> CheckpointResponse:
         """
         Build a CheckpointResponse from a CheckpointDefinition model.
 
+        The stored definition was validated when it was written, so the
+        response models are built with model_construct() to skip revalidation.
+
         Args:
-            checkpoint: CheckpointDefinition model
+            checkpoint: CheckpointDefinition model (may be None when cached_dict is given)
+            cached_dict: checkpoint.to_dict() output or a checkpoint_definitions
+                row mapping already fetched by the caller
 
         Returns:
             CheckpointResponse
         """
-        execution = checkpoint.execution or {}
+        data = cached_dict if cached_dict is not None else checkpoint.to_dict()
+        execution = data["execution"] or {}
         human_only_config = execution.get("human_only_config", {})
+        human_interaction = data["human_interaction"] or {}
 
         # Build input field responses
         input_fields = []
         for field in human_only_config.get("input_fields", []):
-            input_fields.append(InputFieldResponse(
-                field_id=field.get("field_id", str(uuid4())),
-                name=field.get("name", ""),
-                type=field.get("type", "text"),
-                label=field.get("label", ""),
-                required=field.get("required", True),
-                default=field.get("default"),
-                validation=field.get("validation"),
-            ))
+            merged = {**_INPUT_FIELD_DEFAULTS, **field}
+            if "field_id" not in merged:
+                merged["field_id"] = uuid4().hex
+            input_fields.append(InputFieldResponse.model_construct(**merged))
 
         # Build output artifact responses
         output_artifacts = []
-        for artifact in (checkpoint.output or {}).get("artifacts", []):
-            output_artifacts.append(OutputArtifactResponse(
-                artifact_id=artifact.get("artifact_id", str(uuid4())),
-                name=artifact.get("name", ""),
-                format=artifact.get("format", "json"),
-                description=artifact.get("description"),
-            ))
-
-        return CheckpointResponse(
-            checkpoint_id=checkpoint.checkpoint_id,
-            pipeline_id=checkpoint.pipeline_id,
-            checkpoint_name=checkpoint.checkpoint_name,
-            checkpoint_description=checkpoint.checkpoint_description,
+        for artifact in (data["output"] or {}).get("artifacts", []):
+            merged = {**_OUTPUT_ARTIFACT_DEFAULTS, **artifact}
+            if "artifact_id" not in merged:
+                merged["artifact_id"] = uuid4().hex
+            output_artifacts.append(OutputArtifactResponse.model_construct(**merged))
+
+        return CheckpointResponse.model_construct(
+            checkpoint_id=data["checkpoint_id"],
+            pipeline_id=data["pipeline_id"],
+            checkpoint_name=data["checkpoint_name"],
+            checkpoint_description=data["checkpoint_description"],
             execution_mode=execution.get("mode", "human_only"),
-            human_only_config=HumanOnlyConfigResponse(
+            human_only_config=HumanOnlyConfigResponse.model_construct(
                 instructions=human_only_config.get("instructions", ""),
                 input_fields=input_fields,
                 save_as_artifact=human_only_config.get("save_as_artifact", False),
                 artifact_name=human_only_config.get("artifact_name"),
                 artifact_format=human_only_config.get("artifact_format", "json"),
             ),
-            human_interaction=HumanInteractionResponse(
-                requires_approval_to_start=(checkpoint.human_interaction or {}).get("requires_approval_to_start", False),
-                requires_approval_to_complete=(checkpoint.human_interaction or {}).get("requires_approval_to_complete", False),
-                max_revision_iterations=(checkpoint.human_interaction or {}).get("max_revision_iterations", 3),
+            human_interaction=HumanInteractionResponse.model_construct(
+                requires_approval_to_start=human_interaction.get("requires_approval_to_start", False),
+                requires_approval_to_complete=human_interaction.get("requires_approval_to_complete", False),
+                max_revision_iterations=human_interaction.get("max_revision_iterations", 3),
             ),
             output_artifacts=output_artifacts,
-            dependencies=checkpoint.dependencies or {},
-            inputs=checkpoint.inputs or {},
-            execution=checkpoint.execution or {},
-            output=checkpoint.output or {},
-            instructions=checkpoint.instructions or {},
-            created_at=checkpoint.created_at,
-            updated_at=checkpoint.updated_at,
+            dependencies=data["dependencies"] or {},
+            inputs=data["inputs"] or {},
+            execution=execution,
+            output=data["output"] or {},
+            instructions=data["instructions"] or {},
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
         )
 
     @staticmethod
@@ -341,33 +430,30 @@ class CheckpointService:
         # Get pipeline_id for file manager
         pipeline_id = checkpoint.pipeline_id
 
+        # Collect changed columns; JSON columns are copied before merging so
+        # the loaded values are left untouched
+        values_to_update = {}
+
         # Update basic fields if provided
         if data.checkpoint_name is not None:
-            checkpoint.checkpoint_name = data.checkpoint_name
+            values_to_update["checkpoint_name"] = data.checkpoint_name
         if data.checkpoint_description is not None:
-            checkpoint.checkpoint_description = data.checkpoint_description
+            values_to_update["checkpoint_description"] = data.checkpoint_description
 
         # Update human_only_config if provided
         if data.human_only_config is not None:
-            execution = checkpoint.execution or {}
-            existing_human_only_config = execution.get("human_only_config", {})
+            execution = dict(checkpoint.execution or {})
+            existing_human_only_config = dict(execution.get("human_only_config", {}))
 
             # Merge with existing values, only updating fields that are explicitly provided
             if data.human_only_config.instructions is not None:
                 existing_human_only_config["instructions"] = data.human_only_config.instructions
             if data.human_only_config.input_fields is not None:
-                input_fields_with_ids = []
-                for field in data.human_only_config.input_fields:
-                    input_fields_with_ids.append({
-                        "field_id": str(uuid4()),
-                        "name": field.name,
-                        "type": field.type,
-                        "label": field.label,
-                        "required": field.required,
-                        "default": field.default,
-                        "validation": field.validation,
-                    })
-                existing_human_only_config["input_fields"] = input_fields_with_ids
+                field_ids = _batch_uuids(len(data.human_only_config.input_fields))
+                existing_human_only_config["input_fields"] = [
+                    {"field_id": field_id, **field.model_dump()}
+                    for field_id, field in zip(field_ids, data.human_only_config.input_fields)
+                ]
             if data.human_only_config.save_as_artifact is not None:
                 existing_human_only_config["save_as_artifact"] = data.human_only_config.save_as_artifact
             if data.human_only_config.artifact_name is not None:
@@ -376,45 +462,47 @@ class CheckpointService:
                 existing_human_only_config["artifact_format"] = data.human_only_config.artifact_format
 
             execution["human_only_config"] = existing_human_only_config
-            checkpoint.execution = execution
+            values_to_update["execution"] = execution
 
         # Update human_interaction if provided
         if data.human_interaction is not None:
-            existing_interaction = checkpoint.human_interaction or {}
+            existing_interaction = dict(checkpoint.human_interaction or {})
             if data.human_interaction.requires_approval_to_start is not None:
                 existing_interaction["requires_approval_to_start"] = data.human_interaction.requires_approval_to_start
             if data.human_interaction.requires_approval_to_complete is not None:
                 existing_interaction["requires_approval_to_complete"] = data.human_interaction.requires_approval_to_complete
             if data.human_interaction.max_revision_iterations is not None:
                 existing_interaction["max_revision_iterations"] = data.human_interaction.max_revision_iterations
-            checkpoint.human_interaction = existing_interaction
+            values_to_update["human_interaction"] = existing_interaction
 
         # Update output_artifacts if provided
         if data.output_artifacts is not None:
-            output = checkpoint.output or {"artifacts": [], "validation": {"enabled": False}}
-            output_artifacts_with_ids = []
-            for artifact in data.output_artifacts:
-                output_artifacts_with_ids.append({
-                    "artifact_id": str(uuid4()),
-                    "name": artifact.name,
-                    "format": artifact.format,
-                    "description": artifact.description,
-                    "schema": None,
-                })
-            output["artifacts"] = output_artifacts_with_ids
-            checkpoint.output = output
-
-        # Flag JSON columns as modified so SQLAlchemy detects the changes
-        if data.human_only_config is not None:
-            flag_modified(checkpoint, "execution")
-        if data.human_interaction is not None:
-            flag_modified(checkpoint, "human_interaction")
-        if data.output_artifacts is not None:
-            flag_modified(checkpoint, "output")
+            output = dict(checkpoint.output or {"artifacts": [], "validation": {"enabled": False}})
+            artifact_ids = _batch_uuids(len(data.output_artifacts))
+            output["artifacts"] = [
+                {"artifact_id": artifact_id, **artifact.model_dump(), "schema": None}
+                for artifact_id, artifact in zip(artifact_ids, data.output_artifacts)
+            ]
+            values_to_update["output"] = output
+
+        # Write all changes in one UPDATE statement. The timestamp is set here
+        # instead of relying on onupdate so the snapshot below carries it.
+        values_to_update["updated_at"] = datetime.utcnow()
+        session.execute(
+            update(CheckpointDefinition)
+            .where(CheckpointDefinition.checkpoint_id == checkpoint_id)
+            .values(**values_to_update)
+            .execution_options(synchronize_session=False)
+        )
+
+        # Sync the written values onto the loaded checkpoint without marking it dirty
+        for key, value in values_to_update.items():
+            set_committed_value(checkpoint, key, value)
 
-        # Save checkpoint definition to file system
-        file_manager = FileManager(pipeline_id)
-        file_manager.save_checkpoint_definition(checkpoint_id, checkpoint.to_dict())
+        # Save checkpoint definition to file system (snapshotted now, written in the background)
+        checkpoint_dict = checkpoint.to_dict()
+        file_manager = get_file_manager(pipeline_id)
+        enqueue_write(partial(file_manager.save_checkpoint_definition, checkpoint_id, checkpoint_dict))
 
         # Log event
         event = Event(
@@ -430,9 +518,8 @@ class CheckpointService:
         session.add(event)
 
         session.commit()
-        session.refresh(checkpoint)
 
-        return CheckpointService._build_checkpoint_response(checkpoint)
+        return CheckpointService._build_checkpoint_response(checkpoint, cached_dict=checkpoint_dict)
 
     @staticmethod
     def delete_checkpoint(
@@ -449,20 +536,23 @@ class CheckpointService:
         Returns:
             bool: True if deleted, False if not found
         """
-        checkpoint = session.execute(
-            select(CheckpointDefinition).where(CheckpointDefinition.checkpoint_id == checkpoint_id)
-        ).scalar_one_or_none()
-
-        if not checkpoint:
+        # Fetch the checkpoint and its pipeline in one round trip
+        row = session.execute(
+            select(CheckpointDefinition, Pipeline)
+            .outerjoin(Pipeline, Pipeline.pipeline_id == CheckpointDefinition.pipeline_id)
+            .where(CheckpointDefinition.checkpoint_id == checkpoint_id)
+        ).first()
+
+        if not row:
             return False
 
+        checkpoint, pipeline = row
         pipeline_id = checkpoint.pipeline_id
         checkpoint_name = checkpoint.checkpoint_name
 
         # Remove checkpoint_id from pipeline's checkpoint_order
-        pipeline = session.execute(
-            select(Pipeline).where(Pipeline.pipeline_id == pipeline_id)
-        ).scalar_one_or_none()
+        file_manager = get_file_manager(pipeline_id)
+        definition_writes = []
 
         if pipeline:
             checkpoint_order = pipeline.checkpoint_order or []
@@ -472,12 +562,16 @@ class CheckpointService:
                 flag_modified(pipeline, "checkpoint_order")  # Mark JSON column as modified
 
                 # Update pipeline definition file
-                file_manager = FileManager(pipeline_id)
-                file_manager.save_pipeline_definition(pipeline.to_dict())
+                definition_writes.append((file_manager.get_pipeline_definition_path(), pipeline.to_dict()))
 
-        # Delete checkpoint file from file system
-        file_manager = FileManager(pipeline_id)
-        file_manager.delete_checkpoint_definition(checkpoint_id)
+        # Update pipeline definition and delete checkpoint file in one background
+        # operation, queued behind any pending save of the same file so the
+        # delete is not undone
+        enqueue_write(partial(
+            file_manager.save_json_batch,
+            definition_writes,
+            [file_manager.get_checkpoint_definition_path(checkpoint_id)],
+        ))
 
         # Delete checkpoint from database
         session.delete(checkpoint)
@@ -496,25 +590,3 @@ class CheckpointService:
 
         return True
 
-
-# Add helper method to CheckpointDefinition model for dict conversion
-def to_dict(self) -> dict:
-    """Convert checkpoint definition model to dictionary."""
-    return {
-        "checkpoint_id": self.checkpoint_id,
-        "pipeline_id": self.pipeline_id,
-        "checkpoint_name": self.checkpoint_name,
-        "checkpoint_description": self.checkpoint_description,
-        "dependencies": self.dependencies,
-        "inputs": self.inputs,
-        "execution": self.execution,
-        "human_interaction": self.human_interaction,
-        "output": self.output,
-        "instructions": self.instructions,
-        "created_at": self.created_at.isoformat() if self.created_at else None,
-        "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-    }
-
-
-# Monkey patch the to_dict method onto the CheckpointDefinition model
-CheckpointDefinition.to_dict = to_dict
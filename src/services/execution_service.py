@@ -6,15 +6,18 @@ Handles human-only checkpoint workflow: approve start, submit form, approve comp
 """
 
 import json
+import os
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from src.core.file_manager import FileManager
+from src.core.file_manager import decode_json, encode_json, get_file_manager
+from src.core.write_queue import enqueue_write
 from src.db.models import (
     Artifact,
     CheckpointDefinition,
@@ -27,6 +30,47 @@ from src.services.artifact_service import ArtifactService
 from src.utils.logger import get_logger
 
 
+def _get_checkpoint_def(session: Session, checkpoint_id: str) -> Optional[CheckpointDefinition]:
+    """
+    Get a checkpoint definition, memoized for the lifetime of the session.
+
+    Definitions do not change while a run is executing, so chained service
+    calls within one request share a single lookup.
+
+    Args:
+        session: Database session
+        checkpoint_id: Checkpoint definition ID
+
+    Returns:
+        CheckpointDefinition if found, None otherwise
+    """
+    cache = session.info.setdefault("checkpoint_def_cache", {})
+    checkpoint_def = cache.get(checkpoint_id)
+    if checkpoint_def is None:
+        checkpoint_def = session.get(CheckpointDefinition, checkpoint_id)
+        if checkpoint_def is not None:
+            cache[checkpoint_id] = checkpoint_def
+    return checkpoint_def
+
+
+def _load_checkpoint_defs(session: Session, checkpoint_ids: list[str]) -> None:
+    """
+    Load every uncached checkpoint definition in checkpoint_ids with a single
+    IN query and add them to the session's definition cache.
+
+    Args:
+        session: Database session
+        checkpoint_ids: Checkpoint definition IDs to preload
+    """
+    cache = session.info.setdefault("checkpoint_def_cache", {})
+    missing = [checkpoint_id for checkpoint_id in checkpoint_ids if checkpoint_id not in cache]
+    if missing:
+        for checkpoint_def in session.execute(
+            select(CheckpointDefinition).where(CheckpointDefinition.checkpoint_id.in_(missing))
+        ).scalars():
+            cache[checkpoint_def.checkpoint_id] = checkpoint_def
+
+
 class ExecutionService:
     """
     Service for managing checkpoint executions.
@@ -51,9 +95,8 @@ class ExecutionService:
         Returns:
             CheckpointExecution or None
         """
-        return session.execute(
-            select(CheckpointExecution).where(CheckpointExecution.execution_id == execution_id)
-        ).scalar_one_or_none()
+        # Primary-key lookup; served from the identity map when already loaded
+        return session.get(CheckpointExecution, execution_id)
 
     @staticmethod
     def get_execution_detail(session: Session, execution_id: str) -> Optional[dict]:
@@ -67,51 +110,56 @@ class ExecutionService:
         Returns:
             Dictionary with execution details or None
         """
-        execution = ExecutionService.get_execution(session, execution_id)
+        # Load the execution with its checkpoint definition and run in one joined query
+        execution = session.execute(
+            select(CheckpointExecution)
+            .options(
+                joinedload(CheckpointExecution.checkpoint_definition),
+                joinedload(CheckpointExecution.pipeline_run),
+            )
+            .where(CheckpointExecution.execution_id == execution_id)
+        ).unique().scalar_one_or_none()
         if not execution:
             return None
 
-        # Get checkpoint definition
-        checkpoint_def = session.execute(
-            select(CheckpointDefinition).where(
-                CheckpointDefinition.checkpoint_id == execution.checkpoint_id
-            )
-        ).scalar_one_or_none()
-
-        # Get run for context
-        run = session.execute(
-            select(PipelineRun).where(PipelineRun.run_id == execution.run_id)
-        ).scalar_one_or_none()
+        checkpoint_def = execution.checkpoint_definition
+        run = execution.pipeline_run
 
-        # Get staged artifacts (files in temp/artifacts_staging)
+        # Get staged artifacts (files in temp/artifacts_staging). scandir
+        # answers is_file() from the directory listing, so only the size
+        # needs a stat call per file.
         staged_artifacts = []
-        temp_path = Path(execution.temp_workspace_path)
-        staging_dir = temp_path / "artifacts_staging"
-        if staging_dir.exists():
-            for file_path in staging_dir.iterdir():
-                if file_path.is_file():
-                    staged_artifacts.append({
-                        "name": file_path.name,
-                        "size": file_path.stat().st_size,
-                    })
-
-        # Get submitted form data from human interactions (most recent first)
+        staging_dir = os.path.join(execution.temp_workspace_path, "artifacts_staging")
+        try:
+            with os.scandir(staging_dir) as entries:
+                staged_artifacts = [
+                    {"name": entry.name, "size": entry.stat().st_size}
+                    for entry in entries
+                    if entry.is_file()
+                ]
+        except FileNotFoundError:
+            pass
+
+        # Get submitted form data from the most recent form submission
         form_data = None
-        if execution.human_interactions:
-            # Get all script_input interactions (form submissions) and sort by timestamp descending
-            submit_interactions = [
-                hi for hi in execution.human_interactions
-                if hi.interaction_type == "script_input"  # Reusing script_input for form submission
-            ]
-            # Sort by timestamp descending to get the most recent submission
-            submit_interactions.sort(key=lambda hi: hi.timestamp, reverse=True)
-            submit_interaction = submit_interactions[0] if submit_interactions else None
-
-            if submit_interaction and submit_interaction.user_input:
+        submit_input = session.execute(
+            select(HumanInteraction.form_data, HumanInteraction.user_input)
+            .where(
+                HumanInteraction.execution_id == execution_id,
+                HumanInteraction.interaction_type == "script_input",  # Reusing script_input for form submission
+            )
+            .order_by(HumanInteraction.timestamp.desc())
+            .limit(1)
+        ).one_or_none()
+
+        if submit_input:
+            form_data, raw_input = submit_input
+            # Submissions recorded before form_data existed only carry the text
+            if form_data is None and raw_input:
                 try:
-                    form_data = json.loads(submit_interaction.user_input)
+                    form_data = decode_json(raw_input)
                 except json.JSONDecodeError:
-                    form_data = {"raw": submit_interaction.user_input}
+                    form_data = {"raw": raw_input}
 
         # Slice 10: Get previous version artifacts if extending from a previous run
         previous_version_artifacts = []
@@ -232,16 +280,10 @@ class ExecutionService:
             )
 
         # Get checkpoint definition
-        checkpoint_def = session.execute(
-            select(CheckpointDefinition).where(
-                CheckpointDefinition.checkpoint_id == execution.checkpoint_id
-            )
-        ).scalar_one()
+        checkpoint_def = _get_checkpoint_def(session, execution.checkpoint_id)
 
         # Get run for version info
-        run = session.execute(
-            select(PipelineRun).where(PipelineRun.run_id == execution.run_id)
-        ).scalar_one()
+        run = session.get(PipelineRun, execution.run_id)
 
         human_only_config = checkpoint_def.execution.get("human_only_config", {})
         artifacts_created = []
@@ -255,7 +297,7 @@ class ExecutionService:
         interaction = HumanInteraction(
             execution_id=execution_id,
             interaction_type="script_input",  # Reuse for form submission
-            user_input=json.dumps(form_data),
+            form_data=form_data,
             system_response="Form data submitted successfully.",
         )
         session.add(interaction)
@@ -274,28 +316,31 @@ class ExecutionService:
                 )
             ).scalar_one_or_none()
 
-            # Create artifact file
+            # Create artifact file content, encoded once; the byte length
+            # doubles as the stored size
             if artifact_format == "json":
-                content = json.dumps(form_data, indent=2)
+                payload = encode_json(form_data)
             else:  # markdown
-                content = "# Form Data\n\n"
-                for key, value in form_data.items():
-                    content += f"**{key}**: {value}\n\n"
+                parts = ["# Form Data\n\n"]
+                parts.extend(f"**{key}**: {value}\n\n" for key, value in form_data.items())
+                payload = "".join(parts).encode('utf-8')
+            size_bytes = len(payload)
 
             # Use existing artifact_id if revising, otherwise create new one
             if existing_artifact:
                 artifact_id = existing_artifact.artifact_id
             else:
-                artifact_id = str(uuid4())
+                artifact_id = uuid4().hex
 
+            # Write before anything is flushed: the session has only read so
+            # far, so no database write lock is held while waiting on disk
             artifact_file = staging_dir / f"{artifact_name}_{artifact_id}.{artifact_format}"
-            with open(artifact_file, 'w') as f:
-                f.write(content)
+            artifact_file.write_bytes(payload)
 
             # Update existing artifact or create new one
             if existing_artifact:
                 existing_artifact.file_path = str(artifact_file)
-                existing_artifact.size_bytes = len(content.encode())
+                existing_artifact.size_bytes = size_bytes
                 existing_artifact.format = artifact_format
             else:
                 artifact = Artifact(
@@ -304,10 +349,9 @@ class ExecutionService:
                     artifact_name=artifact_name,
                     file_path=str(artifact_file),
                     format=artifact_format,
-                    size_bytes=len(content.encode()),
+                    size_bytes=size_bytes,
                 )
                 session.add(artifact)
-            session.flush()
 
             artifacts_created.append({
                 "artifact_id": artifact_id,
@@ -325,7 +369,8 @@ class ExecutionService:
             session.flush()
             return execution, artifacts_created
         else:
-            # Auto-complete - promote artifacts and move to next checkpoint
+            # Auto-complete - promote artifacts and move to next checkpoint.
+            # Flush first so execution.artifacts loads the new artifact.
             session.flush()
             result = ExecutionService._complete_checkpoint_and_advance(
                 session=session,
@@ -348,61 +393,50 @@ class ExecutionService:
         - Create next checkpoint execution if applicable
         - Update run status
         """
-        # Get checkpoint definition and run
-        checkpoint_def = session.execute(
-            select(CheckpointDefinition).where(
-                CheckpointDefinition.checkpoint_id == execution.checkpoint_id
-            )
-        ).scalar_one()
-
-        run = session.execute(
-            select(PipelineRun).where(PipelineRun.run_id == execution.run_id)
-        ).scalar_one()
+        # One timestamp for every row touched by this completion
+        now = datetime.utcnow()
+
+        # Get run and the pipeline settings needed to advance in a single query.
+        # The pipeline is only read here, so just its two columns are fetched.
+        run, checkpoint_order, auto_advance = session.execute(
+            select(PipelineRun, Pipeline.checkpoint_order, Pipeline.auto_advance)
+            .join(Pipeline, Pipeline.pipeline_id == PipelineRun.pipeline_id)
+            .where(PipelineRun.run_id == execution.run_id)
+        ).one()
+
+        # Load the current and next checkpoint definitions together
+        current_position = execution.checkpoint_position
+        _load_checkpoint_defs(
+            session,
+            [execution.checkpoint_id, *checkpoint_order[current_position + 1:current_position + 2]],
+        )
+        checkpoint_def = _get_checkpoint_def(session, execution.checkpoint_id)
 
-        # Get pipeline for checkpoint order
-        pipeline = session.execute(
-            select(Pipeline).where(Pipeline.pipeline_id == run.pipeline_id)
-        ).scalar_one()
+        fm = get_file_manager(run.pipeline_id)
 
         # Promote artifacts if requested
         promoted_artifacts = []
         if promote_artifacts:
-            fm = FileManager(run.pipeline_id)
-
-            # Get all artifacts for this execution
-            artifacts = session.execute(
-                select(Artifact).where(Artifact.execution_id == execution.execution_id)
-            ).scalars().all()
-
-            for artifact in artifacts:
-                # Parse file name to get components
-                staging_path = Path(artifact.file_path)
-                stem = staging_path.stem  # e.g., "form_data_abc123"
-                # Split by last underscore to separate name from ID
-                parts = stem.rsplit('_', 1)
-                if len(parts) == 2:
-                    name_part = parts[0]
-                    id_part = parts[1]
-                else:
-                    name_part = stem
-                    id_part = artifact.artifact_id
-
-                artifact_format = staging_path.suffix.lstrip('.')
 
+            # All artifacts for this execution; preloaded by approve_complete,
+            # otherwise loaded here on first access
+            for artifact in execution.artifacts:
+                # The staging file is named from the stored columns
+                # ({artifact_name}_{artifact_id}.{format}), so no parsing is needed
                 try:
                     permanent_path = fm.promote_artifact_to_permanent(
                         execution_id=execution.execution_id,
                         run_version=run.run_version,
                         checkpoint_name=checkpoint_def.checkpoint_name,
                         checkpoint_position=execution.checkpoint_position,
-                        artifact_name=name_part,
-                        artifact_id=id_part,
-                        artifact_format=artifact_format,
+                        artifact_name=artifact.artifact_name,
+                        artifact_id=artifact.artifact_id,
+                        artifact_format=artifact.format,
                     )
 
                     # Update artifact record
                     artifact.file_path = str(permanent_path)
-                    artifact.promoted_to_permanent_at = datetime.utcnow()
+                    artifact.promoted_to_permanent_at = now
 
                     promoted_artifacts.append({
                         "artifact_name": artifact.artifact_name,
@@ -414,7 +448,7 @@ class ExecutionService:
 
         # Update execution status
         execution.status = "completed"
-        execution.completed_at = datetime.utcnow()
+        execution.completed_at = now
 
         # Record human interaction
         interaction = HumanInteraction(
@@ -426,8 +460,6 @@ class ExecutionService:
         session.add(interaction)
 
         # Check if there's a next checkpoint
-        current_position = execution.checkpoint_position
-        checkpoint_order = pipeline.checkpoint_order
         next_checkpoint_id = None
         next_execution = None
 
@@ -435,16 +467,11 @@ class ExecutionService:
             next_checkpoint_id = checkpoint_order[current_position + 1]
 
             # Get next checkpoint definition
-            next_checkpoint_def = session.execute(
-                select(CheckpointDefinition).where(
-                    CheckpointDefinition.checkpoint_id == next_checkpoint_id
-                )
-            ).scalar_one_or_none()
+            next_checkpoint_def = _get_checkpoint_def(session, next_checkpoint_id)
 
             if next_checkpoint_def:
                 # Clean up the PREVIOUS checkpoint's temp workspace before starting next
                 # This is critical: temp should be deleted after next checkpoint starts
-                fm = FileManager(run.pipeline_id)
                 fm.delete_temp_execution_directory(execution.execution_id)
 
                 # Create next checkpoint execution
@@ -455,6 +482,7 @@ class ExecutionService:
                     checkpoint_def=next_checkpoint_def,
                     position=current_position + 1,
                     file_manager=fm,
+                    now=now,
                 )
 
                 # Update run's current checkpoint
@@ -462,30 +490,29 @@ class ExecutionService:
                 run.current_checkpoint_position = current_position + 1
 
                 # Check if pipeline has auto_advance enabled
-                if pipeline.auto_advance:
+                if auto_advance:
                     human_interaction = next_checkpoint_def.human_interaction or {}
                     requires_approval = human_interaction.get("requires_approval_to_start", False)
 
                     if not requires_approval:
                         # Auto-start the next checkpoint
                         next_execution.status = "in_progress"
-                        next_execution.started_at = datetime.utcnow()
+                        next_execution.started_at = now
                 else:
                     # Require approval to start
                     next_execution.status = "waiting_approval_to_start"
         else:
             # No more checkpoints - complete the run
             run.status = "completed"
-            run.completed_at = datetime.utcnow()
+            run.completed_at = now
             run.current_checkpoint_id = None
             run.current_checkpoint_position = None
 
             # Clean up temp workspace
-            fm = FileManager(run.pipeline_id)
             fm.delete_temp_execution_directory(execution.execution_id)
 
             # Update run_info.json with final status
-            fm.save_run_info(run.run_version, {
+            enqueue_write(partial(fm.save_run_info, run.run_version, {
                 "run_id": run.run_id,
                 "pipeline_id": run.pipeline_id,
                 "run_version": run.run_version,
@@ -495,7 +522,7 @@ class ExecutionService:
                 "completed_at": run.completed_at.isoformat() if run.completed_at else None,
                 "previous_run_id": run.previous_run_id,
                 "extends_from_run_version": run.extends_from_run_version,
-            })
+            }))
 
         session.flush()
 
@@ -555,7 +582,12 @@ class ExecutionService:
         Raises:
             ValueError: If execution not found or in wrong state
         """
-        execution = ExecutionService.get_execution(session, execution_id)
+        # Load the artifacts to promote along with the execution
+        execution = session.execute(
+            select(CheckpointExecution)
+            .options(selectinload(CheckpointExecution.artifacts))
+            .where(CheckpointExecution.execution_id == execution_id)
+        ).scalar_one_or_none()
         if not execution:
             raise ValueError(f"Execution with ID '{execution_id}' not found")
 
@@ -657,11 +689,7 @@ class ExecutionService:
         if not execution:
             raise ValueError(f"Execution with ID '{execution_id}' not found")
 
-        checkpoint_def = session.execute(
-            select(CheckpointDefinition).where(
-                CheckpointDefinition.checkpoint_id == execution.checkpoint_id
-            )
-        ).scalar_one_or_none()
+        checkpoint_def = _get_checkpoint_def(session, execution.checkpoint_id)
 
         if not checkpoint_def:
             return []
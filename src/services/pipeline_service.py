@@ -4,6 +4,7 @@ Pipeline Service
 Business logic for pipeline CRUD operations.
 """
 
+from functools import partial
 from typing import Optional
 from uuid import uuid4
 
@@ -11,7 +12,8 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
-from src.core.file_manager import FileManager
+from src.core.file_manager import get_file_manager
+from src.core.write_queue import enqueue_write
 from src.db.database import init_pipeline_db
 from src.db.models import CheckpointDefinition, Event, Pipeline
 from src.models.schemas import PipelineCreate, PipelineDetailResponse, PipelineResponse, PipelineUpdate
@@ -66,14 +68,15 @@ class PipelineService:
         session.flush()
 
         # Create file system structure
-        file_manager = FileManager(pipeline_id)
+        file_manager = get_file_manager(pipeline_id)
         file_manager.initialize_pipeline_structure()
 
         # Initialize pipeline-specific database (per spec: .pipeline_system/db/state.db)
         init_pipeline_db(pipeline_id)
 
-        # Save pipeline definition to file
-        file_manager.save_pipeline_definition(pipeline.to_dict())
+        # Save pipeline definition to file (snapshotted now, written in the
+        # background in order with every other pipeline.json write)
+        enqueue_write(partial(file_manager.save_pipeline_definition, pipeline.to_dict()))
 
         # Log event
         event = Event(
@@ -313,9 +316,9 @@ class PipelineService:
         if data.auto_advance is not None:
             pipeline.auto_advance = data.auto_advance
 
-        # Update file system definition
-        file_manager = FileManager(pipeline_id)
-        file_manager.save_pipeline_definition(pipeline.to_dict())
+        # Update file system definition (snapshotted now, written in the background)
+        file_manager = get_file_manager(pipeline_id)
+        enqueue_write(partial(file_manager.save_pipeline_definition, pipeline.to_dict()))
 
         # Log event
         event = Event(
@@ -435,9 +438,9 @@ class PipelineService:
         # Increment pipeline definition version since checkpoint order changed
         pipeline.pipeline_definition_version += 1
 
-        # Update file system definition
-        file_manager = FileManager(pipeline_id)
-        file_manager.save_pipeline_definition(pipeline.to_dict())
+        # Update file system definition (snapshotted now, written in the background)
+        file_manager = get_file_manager(pipeline_id)
+        enqueue_write(partial(file_manager.save_pipeline_definition, pipeline.to_dict()))
 
         # Log event
         event = Event(
@@ -480,8 +483,8 @@ def to_dict(self) -> dict:
         "pipeline_definition_version": self.pipeline_definition_version,
         "checkpoint_order": self.checkpoint_order,
         "auto_advance": self.auto_advance,
-        "created_at": self.created_at.isoformat() if self.created_at else None,
-        "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        "created_at": self.created_at,
+        "updated_at": self.updated_at,
     }
 
 
@@ -6,13 +6,16 @@ Handles run creation, status tracking, and checkpoint execution initialization.
 """
 
 from datetime import datetime
+from functools import partial
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.core.file_manager import FileManager
+from src.core.file_manager import FileManager, get_file_manager
+from src.core.write_queue import enqueue_write
 from src.db.models import (
     CheckpointDefinition,
     CheckpointExecution,
@@ -23,6 +26,13 @@ from src.db.models import (
 from src.utils.logger import get_logger
 
 
+# Rows fetched per batch when streaming a run's executions
+_RUN_DETAIL_BATCH_SIZE = 100
+
+# Attempts at claiming a run version before a collision is re-raised
+_RUN_VERSION_ATTEMPTS = 3
+
+
 class RunService:
     """
     Service for managing pipeline runs.
@@ -31,47 +41,6 @@ class RunService:
     and initializing checkpoint executions.
     """
 
-    @staticmethod
-    def get_latest_valid_run(session: Session, pipeline_id: str) -> Optional[PipelineRun]:
-        """
-        Get the latest valid (non-archived, non-errored) run for a pipeline.
-
-        Args:
-            session: Database session
-            pipeline_id: Pipeline ID
-
-        Returns:
-            Latest valid PipelineRun or None
-        """
-        # Get the latest run by version number
-        # For now, we consider all runs as valid (archiving is in Phase 3)
-        result = session.execute(
-            select(PipelineRun)
-            .where(PipelineRun.pipeline_id == pipeline_id)
-            .order_by(PipelineRun.run_version.desc())
-            .limit(1)
-        )
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    def get_next_run_version(session: Session, pipeline_id: str) -> int:
-        """
-        Get the next run version number for a pipeline.
-
-        Args:
-            session: Database session
-            pipeline_id: Pipeline ID
-
-        Returns:
-            Next run version number (1 if no runs exist)
-        """
-        result = session.execute(
-            select(func.max(PipelineRun.run_version))
-            .where(PipelineRun.pipeline_id == pipeline_id)
-        )
-        max_version = result.scalar()
-        return (max_version or 0) + 1
-
     @staticmethod
     def create_run(
         session: Session,
@@ -81,6 +50,10 @@ class RunService:
         """
         Create a new pipeline run.
 
+        A run version collision with a concurrent create rolls back the
+        session's transaction before retrying, so call this before making
+        other changes in the session.
+
         Args:
             session: Database session
             pipeline_id: Pipeline ID to create run for
@@ -91,17 +64,27 @@ class RunService:
 
         Raises:
             ValueError: If pipeline not found or has no checkpoints
+            IntegrityError: If every attempt at claiming a run version collided
         """
-        # Get pipeline
-        pipeline = session.execute(
-            select(Pipeline).where(Pipeline.pipeline_id == pipeline_id)
-        ).scalar_one_or_none()
+        # Get the pipeline's checkpoint_order and its latest valid run in one
+        # query. This is the only latest-valid-run lookup: all runs are
+        # currently valid, so it is the highest-versioned run. Archive
+        # filtering (Phase 3) belongs in the outer join's ON clause.
+        row = session.execute(
+            select(Pipeline.checkpoint_order, PipelineRun)
+            .outerjoin(PipelineRun, PipelineRun.pipeline_id == Pipeline.pipeline_id)
+            .where(Pipeline.pipeline_id == pipeline_id)
+            .order_by(PipelineRun.run_version.desc())
+            .limit(1)
+        ).one_or_none()
 
-        if not pipeline:
+        if not row:
             raise ValueError(f"Pipeline with ID '{pipeline_id}' not found")
 
+        checkpoint_order, latest_run = row
+
         # Check if pipeline has checkpoints
-        if not pipeline.checkpoint_order:
+        if not checkpoint_order:
             raise ValueError(f"Pipeline has no checkpoints. Add at least one checkpoint before starting a run.")
 
         # Determine previous run
@@ -117,32 +100,49 @@ class RunService:
             if previous_run.pipeline_id != pipeline_id:
                 raise ValueError(f"Run '{extends_from_run_id}' does not belong to pipeline '{pipeline_id}'")
         else:
-            # Find the latest valid run automatically
-            previous_run = RunService.get_latest_valid_run(session, pipeline_id)
-
-        # Get next run version
-        run_version = RunService.get_next_run_version(session, pipeline_id)
-
-        # Create the run
-        run = PipelineRun(
-            pipeline_id=pipeline_id,
-            run_version=run_version,
-            status="not_started",
-            current_checkpoint_id=None,
-            current_checkpoint_position=None,
-            previous_run_id=previous_run.run_id if previous_run else None,
-            extends_from_run_version=previous_run.run_version if previous_run else None,
-        )
+            # Use the latest valid run automatically
+            previous_run = latest_run
 
-        session.add(run)
-        session.flush()
+        previous_run_id = previous_run.run_id if previous_run else None
+        extends_from_run_version = previous_run.run_version if previous_run else None
+
+        # Create the run. The version is computed by the INSERT itself; if a
+        # concurrent create claims it first, the unique (pipeline_id,
+        # run_version) index rejects the row and the INSERT is retried
+        next_version = (
+            select(func.coalesce(func.max(PipelineRun.run_version), 0) + 1)
+            .where(PipelineRun.pipeline_id == pipeline_id)
+            .scalar_subquery()
+        )
+        for attempt in range(_RUN_VERSION_ATTEMPTS):
+            try:
+                run = session.execute(
+                    insert(PipelineRun)
+                    .values(
+                        pipeline_id=pipeline_id,
+                        run_version=next_version,
+                        status="not_started",
+                        previous_run_id=previous_run_id,
+                        extends_from_run_version=extends_from_run_version,
+                    )
+                    .returning(PipelineRun)
+                ).scalar_one()
+                break
+            except IntegrityError:
+                # The failed statement aborts the transaction on PostgreSQL,
+                # so start a fresh one; this method hasn't written anything else
+                session.rollback()
+                if attempt == _RUN_VERSION_ATTEMPTS - 1:
+                    raise
+
+        run_version = run.run_version
 
         # Initialize file manager for the pipeline
-        fm = FileManager(pipeline_id)
+        fm = get_file_manager(pipeline_id)
         fm.create_run_directory(run_version)
 
-        # Save run info to file system
-        fm.save_run_info(run_version, {
+        # Save run info to file system (written in the background)
+        enqueue_write(partial(fm.save_run_info, run_version, {
             "run_id": run.run_id,
             "pipeline_id": pipeline_id,
             "run_version": run_version,
@@ -150,7 +150,7 @@ class RunService:
             "created_at": run.created_at.isoformat(),
             "previous_run_id": run.previous_run_id,
             "extends_from_run_version": run.extends_from_run_version,
-        })
+        }))
 
         # Log to system.log
         logger = get_logger(pipeline_id)
@@ -181,40 +181,40 @@ class RunService:
         Raises:
             ValueError: If run not found, already started, or has no checkpoints
         """
-        # Get the run
-        run = session.execute(
-            select(PipelineRun).where(PipelineRun.run_id == run_id)
-        ).scalar_one_or_none()
+        # Get the run, the pipeline's checkpoint_order and the definition of
+        # the first checkpoint in that order in a single query
+        row = session.execute(
+            select(PipelineRun, Pipeline.checkpoint_order, CheckpointDefinition)
+            .join(Pipeline, Pipeline.pipeline_id == PipelineRun.pipeline_id)
+            .outerjoin(
+                CheckpointDefinition,
+                CheckpointDefinition.checkpoint_id == Pipeline.checkpoint_order[0].as_string(),
+            )
+            .where(PipelineRun.run_id == run_id)
+        ).one_or_none()
 
-        if not run:
+        if not row:
             raise ValueError(f"Run with ID '{run_id}' not found")
 
+        run, checkpoint_order, checkpoint_def = row
+
         if run.status != "not_started":
             raise ValueError(f"Run has already been started (current status: {run.status})")
 
-        # Get pipeline to access checkpoint_order
-        pipeline = session.execute(
-            select(Pipeline).where(Pipeline.pipeline_id == run.pipeline_id)
-        ).scalar_one()
-
-        if not pipeline.checkpoint_order:
+        if not checkpoint_order:
             raise ValueError(f"Pipeline has no checkpoints")
 
         # Get the first checkpoint ID from checkpoint_order
-        first_checkpoint_id = pipeline.checkpoint_order[0]
-
-        # Get the checkpoint definition
-        checkpoint_def = session.execute(
-            select(CheckpointDefinition).where(
-                CheckpointDefinition.checkpoint_id == first_checkpoint_id
-            )
-        ).scalar_one_or_none()
+        first_checkpoint_id = checkpoint_order[0]
 
         if not checkpoint_def:
             raise ValueError(f"First checkpoint '{first_checkpoint_id}' not found")
 
         # Initialize file manager
-        fm = FileManager(run.pipeline_id)
+        fm = get_file_manager(run.pipeline_id)
+
+        # One timestamp for the run start and its first execution
+        now = datetime.utcnow()
 
         # Create the first checkpoint execution
         execution = RunService.create_checkpoint_execution(
@@ -223,18 +223,19 @@ class RunService:
             checkpoint_def=checkpoint_def,
             position=0,
             file_manager=fm,
+            now=now,
         )
 
         # Update run status
         run.status = "in_progress"
         run.current_checkpoint_id = execution.checkpoint_id
         run.current_checkpoint_position = 0
-        run.started_at = datetime.utcnow()
+        run.started_at = now
 
         session.flush()
 
         # Update run_info.json with new status
-        fm.save_run_info(run.run_version, {
+        enqueue_write(partial(fm.save_run_info, run.run_version, {
             "run_id": run.run_id,
             "pipeline_id": run.pipeline_id,
             "run_version": run.run_version,
@@ -245,7 +246,7 @@ class RunService:
             "extends_from_run_version": run.extends_from_run_version,
             "current_checkpoint_id": run.current_checkpoint_id,
             "current_checkpoint_position": run.current_checkpoint_position,
-        })
+        }))
 
         # Update latest symlink
         fm.update_latest_symlink(run.run_version)
@@ -270,6 +271,7 @@ class RunService:
         checkpoint_def: CheckpointDefinition,
         position: int,
         file_manager: FileManager,
+        now: Optional[datetime] = None,
     ) -> CheckpointExecution:
         """
         Create a checkpoint execution for a run.
@@ -280,11 +282,14 @@ class RunService:
             checkpoint_def: The CheckpointDefinition
             position: Checkpoint position in pipeline
             file_manager: FileManager instance
+            now: Timestamp for the rows created here (defaults to the current UTC time)
 
         Returns:
             Created CheckpointExecution
         """
-        execution_id = str(uuid4())
+        execution_id = uuid4().hex
+        if now is None:
+            now = datetime.utcnow()
 
         # Create temp workspace
         temp_dir = file_manager.create_temp_execution_directory(execution_id)
@@ -303,43 +308,39 @@ class RunService:
         retry_config = checkpoint_def.execution.get("retry_config", {})
         max_attempts = retry_config.get("max_auto_retries", 0) + 1  # +1 for initial attempt
 
+        # Check if approval is required to start; otherwise the execution
+        # auto-starts (handled by execution flow, Slice 7)
+        requires_approval = human_interaction.get("requires_approval_to_start", False)
+
         # Create execution
         execution = CheckpointExecution(
             execution_id=execution_id,
             run_id=run.run_id,
             checkpoint_id=checkpoint_def.checkpoint_id,
             checkpoint_position=position,
-            status="pending",
+            status="waiting_approval_to_start" if requires_approval else "in_progress",
             attempt_number=1,
             max_attempts=max_attempts,
             revision_iteration=0,
             max_revision_iterations=human_interaction.get("max_revision_iterations", 3),
             temp_workspace_path=str(temp_dir),
             permanent_output_path=str(permanent_dir),
+            created_at=now,
+            started_at=None if requires_approval else now,
         )
-
         session.add(execution)
-        session.flush()
-
-        # Check if approval is required to start
-        requires_approval = human_interaction.get("requires_approval_to_start", False)
 
         if requires_approval:
-            execution.status = "waiting_approval_to_start"
-
             # Create human interaction record
-            interaction = HumanInteraction(
+            session.add(HumanInteraction(
                 execution_id=execution_id,
+                timestamp=now,
                 interaction_type="approval_to_start",
                 user_input=None,
                 system_response="Waiting for user approval to start this checkpoint.",
-            )
-            session.add(interaction)
-        else:
-            # Auto-start - will be handled by execution flow (Slice 7)
-            execution.status = "in_progress"
-            execution.started_at = datetime.utcnow()
+            ))
 
+        # The execution and its interaction are inserted in one flush
         session.flush()
 
         return execution
@@ -372,55 +373,74 @@ class RunService:
         Returns:
             Dictionary with run details or None
         """
-        run = RunService.get_run(session, run_id)
-
-        if not run:
+        # Get the run with the pipeline name and checkpoint order in one query
+        row = session.execute(
+            select(PipelineRun, Pipeline.pipeline_name, Pipeline.checkpoint_order)
+            .outerjoin(Pipeline, Pipeline.pipeline_id == PipelineRun.pipeline_id)
+            .where(PipelineRun.run_id == run_id)
+        ).one_or_none()
+
+        if not row:
             return None
 
-        # Get pipeline for name
-        pipeline = session.execute(
-            select(Pipeline).where(Pipeline.pipeline_id == run.pipeline_id)
-        ).scalar_one_or_none()
-
-        # Get checkpoint executions
-        executions = session.execute(
-            select(CheckpointExecution)
+        run, pipeline_name, checkpoint_order = row
+
+        # Stream the run's executions with their checkpoint names. Only the
+        # summary columns are selected, so rows are plain tuples rather than
+        # ORM instances; the outer join keeps executions whose definition has
+        # been deleted, and a window aggregate repeats the completed count on
+        # every row.
+        completed_count_col = (
+            func.count()
+            .filter(CheckpointExecution.status.in_(("completed", "waiting_approval_to_complete")))
+            .over()
+            .label("completed_count")
+        )
+        rows = session.execute(
+            select(
+                CheckpointExecution.execution_id,
+                CheckpointExecution.checkpoint_id,
+                CheckpointDefinition.checkpoint_name,
+                CheckpointExecution.checkpoint_position,
+                CheckpointExecution.status,
+                CheckpointExecution.attempt_number,
+                CheckpointExecution.revision_iteration,
+                CheckpointExecution.created_at,
+                CheckpointExecution.started_at,
+                CheckpointExecution.completed_at,
+                completed_count_col,
+            )
+            .outerjoin(
+                CheckpointDefinition,
+                CheckpointDefinition.checkpoint_id == CheckpointExecution.checkpoint_id,
+            )
             .where(CheckpointExecution.run_id == run_id)
             .order_by(CheckpointExecution.checkpoint_position)
-        ).scalars().all()
+            .execution_options(yield_per=_RUN_DETAIL_BATCH_SIZE)
+        )
 
         # Build checkpoint execution summaries
         execution_summaries = []
-        for exec_obj in executions:
-            checkpoint_def = session.execute(
-                select(CheckpointDefinition).where(
-                    CheckpointDefinition.checkpoint_id == exec_obj.checkpoint_id
-                )
-            ).scalar_one_or_none()
-
+        completed_count = 0
+        for row in rows:
+            completed_count = row.completed_count
             execution_summaries.append({
-                "execution_id": exec_obj.execution_id,
-                "checkpoint_id": exec_obj.checkpoint_id,
-                "checkpoint_name": checkpoint_def.checkpoint_name if checkpoint_def else None,
-                "checkpoint_position": exec_obj.checkpoint_position,
-                "status": exec_obj.status,
-                "attempt_number": exec_obj.attempt_number,
-                "revision_iteration": exec_obj.revision_iteration,
-                "created_at": exec_obj.created_at.isoformat() if exec_obj.created_at else None,
-                "started_at": exec_obj.started_at.isoformat() if exec_obj.started_at else None,
-                "completed_at": exec_obj.completed_at.isoformat() if exec_obj.completed_at else None,
+                "execution_id": row.execution_id,
+                "checkpoint_id": row.checkpoint_id,
+                "checkpoint_name": row.checkpoint_name,
+                "checkpoint_position": row.checkpoint_position,
+                "status": row.status,
+                "attempt_number": row.attempt_number,
+                "revision_iteration": row.revision_iteration,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "started_at": row.started_at.isoformat() if row.started_at else None,
+                "completed_at": row.completed_at.isoformat() if row.completed_at else None,
             })
 
-        # Count completed checkpoints
-        completed_count = sum(
-            1 for e in executions
-            if e.status in ("completed", "waiting_approval_to_complete")
-        )
-
         return {
             "run_id": run.run_id,
             "pipeline_id": run.pipeline_id,
-            "pipeline_name": pipeline.pipeline_name if pipeline else None,
+            "pipeline_name": pipeline_name,
             "run_version": run.run_version,
             "status": run.status,
             "current_checkpoint_id": run.current_checkpoint_id,
@@ -432,7 +452,7 @@ class RunService:
             "completed_at": run.completed_at.isoformat() if run.completed_at else None,
             "paused_at": run.paused_at.isoformat() if run.paused_at else None,
             "last_resumed_at": run.last_resumed_at.isoformat() if run.last_resumed_at else None,
-            "checkpoint_count": len(pipeline.checkpoint_order) if pipeline else 0,
+            "checkpoint_count": len(checkpoint_order) if checkpoint_order else 0,
             "completed_checkpoints": completed_count,
             "checkpoint_executions": execution_summaries,
         }
@@ -477,8 +497,11 @@ class RunService:
         Returns:
             Total count of runs
         """
+        # COUNT(*) rather than COUNT(run_id): no column needs checking for
+        # NULL, so the count is answered from a pipeline_id index alone
         result = session.execute(
-            select(func.count(PipelineRun.run_id))
+            select(func.count())
+            .select_from(PipelineRun)
             .where(PipelineRun.pipeline_id == pipeline_id)
         )
         return result.scalar()
@@ -521,8 +544,8 @@ class RunService:
         session.flush()
 
         # Update run_info.json
-        fm = FileManager(run.pipeline_id)
-        fm.save_run_info(run.run_version, {
+        fm = get_file_manager(run.pipeline_id)
+        enqueue_write(partial(fm.save_run_info, run.run_version, {
             "run_id": run.run_id,
             "pipeline_id": run.pipeline_id,
             "run_version": run.run_version,
@@ -534,7 +557,7 @@ class RunService:
             "extends_from_run_version": run.extends_from_run_version,
             "current_checkpoint_id": run.current_checkpoint_id,
             "current_checkpoint_position": run.current_checkpoint_position,
-        })
+        }))
 
         # Log to system.log
         logger = get_logger(run.pipeline_id)
@@ -580,14 +603,15 @@ class RunService:
         if run.status != "paused":
             raise ValueError(f"Cannot resume run with status '{run.status}'. Only 'paused' runs can be resumed.")
 
-        # Get pipeline to access checkpoint_order
-        pipeline = session.execute(
-            select(Pipeline).where(Pipeline.pipeline_id == run.pipeline_id)
+        # Get the pipeline's checkpoint_order; only that column is needed
+        checkpoint_order = session.execute(
+            select(Pipeline.checkpoint_order).where(Pipeline.pipeline_id == run.pipeline_id)
         ).scalar_one()
 
         # Update run status back to in_progress
         run.status = "in_progress"
-        run.last_resumed_at = datetime.utcnow()
+        now = datetime.utcnow()
+        run.last_resumed_at = now
 
         session.flush()
 
@@ -606,25 +630,22 @@ class RunService:
             if latest_execution.status == "completed":
                 next_position = latest_execution.checkpoint_position + 1
 
-                if next_position < len(pipeline.checkpoint_order):
+                if next_position < len(checkpoint_order):
                     # There's another checkpoint to execute
-                    next_checkpoint_id = pipeline.checkpoint_order[next_position]
+                    next_checkpoint_id = checkpoint_order[next_position]
 
-                    checkpoint_def = session.execute(
-                        select(CheckpointDefinition).where(
-                            CheckpointDefinition.checkpoint_id == next_checkpoint_id
-                        )
-                    ).scalar_one_or_none()
+                    checkpoint_def = session.get(CheckpointDefinition, next_checkpoint_id)
 
                     if checkpoint_def:
                         # Create the next checkpoint execution
-                        fm = FileManager(run.pipeline_id)
+                        fm = get_file_manager(run.pipeline_id)
                         execution = RunService.create_checkpoint_execution(
                             session=session,
                             run=run,
                             checkpoint_def=checkpoint_def,
                             position=next_position,
                             file_manager=fm,
+                            now=now,
                         )
 
                         # Update run's current checkpoint
@@ -634,8 +655,8 @@ class RunService:
                         session.flush()
 
         # Update run_info.json
-        fm = FileManager(run.pipeline_id)
-        fm.save_run_info(run.run_version, {
+        fm = get_file_manager(run.pipeline_id)
+        enqueue_write(partial(fm.save_run_info, run.run_version, {
             "run_id": run.run_id,
             "pipeline_id": run.pipeline_id,
             "run_version": run.run_version,
@@ -648,7 +669,7 @@ class RunService:
             "extends_from_run_version": run.extends_from_run_version,
             "current_checkpoint_id": run.current_checkpoint_id,
             "current_checkpoint_position": run.current_checkpoint_position,
-        })
+        }))
 
         # Log to system.log
         logger = get_logger(run.pipeline_id)
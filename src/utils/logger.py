@@ -3,19 +3,105 @@ Pipeline System Logger
 
 Handles logging to pipeline-specific system.log files.
 Each pipeline has its own log file in .pipeline_system/logs/system.log
+
+Callers never write to the log files themselves: records are published to a
+bounded in-memory buffer and a single daemon thread writes them out, so
+request threads don't contend on file handler locks. The writer flushes each
+file once per drained batch rather than once per record.
 """
 
 import logging
 import os
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
 
 import config
 
-# Thread lock for safe file operations
-_log_lock = Lock()
+# Maximum number of buffered records; new records are dropped when full
+LOG_BUFFER_CAPACITY = 4096
+
+# Log locations and level, resolved once from config
+_BASE_PIPELINES_PATH = Path(config.BASE_PIPELINES_PATH)
+_LOGS_SUBDIR = Path(config.PIPELINE_SYSTEM_DIR) / config.PIPELINE_LOGS_DIR
+_LOG_FILENAME = config.SYSTEM_LOG_FILENAME
+_LOG_LEVEL = getattr(logging, config.LOG_LEVEL, logging.INFO)
+
 _loggers = {}  # Cache of loggers per pipeline_id
+_log_dirs_ready: set = set()  # Log directories already created by this process
+_loggers_lock = threading.Lock()
+
+# Pending (logger, record) pairs. deque append/popleft are atomic, so
+# publishing needs no lock.
+_log_buffer: deque = deque()
+_log_ready = threading.Event()
+_log_writer: threading.Thread | None = None
+_log_writer_lock = threading.Lock()
+
+
+class _BatchedFileHandler(logging.FileHandler):
+    """
+    FileHandler that doesn't flush after every record.
+
+    The log writer flushes once per drained batch via flush_batch(), so a
+    burst of records costs one write to disk instead of one per record.
+    """
+
+    def flush(self) -> None:
+        """Defer flushing to flush_batch()."""
+
+    def flush_batch(self) -> None:
+        """Flush records written since the last batch."""
+        super().flush()
+
+
+def _write_pending_logs() -> None:
+    """Write out every buffered record, then flush each handler once."""
+    written = set()
+    while True:
+        try:
+            logger, record = _log_buffer.popleft()
+        except IndexError:
+            break
+        logger.handle(record)
+        written.add(logger)
+
+    for logger in written:
+        for handler in logger.handlers:
+            handler.flush_batch()
+
+
+def _log_writer_loop() -> None:
+    """Write buffered records whenever new ones are published."""
+    while True:
+        _log_ready.wait()
+        _log_ready.clear()
+        _write_pending_logs()
+
+
+def _ensure_log_writer() -> None:
+    """Start the log writer thread on first use."""
+    global _log_writer
+
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                _log_writer = threading.Thread(
+                    target=_log_writer_loop,
+                    name="pipeline-log-writer",
+                    daemon=True,
+                )
+                _log_writer.start()
+
+
+def flush_logs() -> None:
+    """
+    Write out every buffered record from the calling thread.
+
+    Called on application shutdown so buffered records are not lost.
+    """
+    _write_pending_logs()
 
 
 class PipelineLogger:
@@ -33,23 +119,25 @@ class PipelineLogger:
             pipeline_id: The pipeline UUID
         """
         self.pipeline_id = pipeline_id
-        self.base_path = Path(config.BASE_PIPELINES_PATH) / pipeline_id
-        self.logs_dir = self.base_path / config.PIPELINE_SYSTEM_DIR / config.PIPELINE_LOGS_DIR
-        self.log_file = self.logs_dir / config.SYSTEM_LOG_FILENAME
+        self.base_path = _BASE_PIPELINES_PATH / pipeline_id
+        self.logs_dir = self.base_path / _LOGS_SUBDIR
+        self.log_file = self.logs_dir / _LOG_FILENAME
 
-        # Ensure logs directory exists
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure logs directory exists (once per directory per process)
+        if self.logs_dir not in _log_dirs_ready:
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            _log_dirs_ready.add(self.logs_dir)
 
         # Create logger
         self.logger = logging.getLogger(f"pipeline.{pipeline_id}")
-        self.logger.setLevel(getattr(logging, config.LOG_LEVEL, logging.INFO))
+        self.logger.setLevel(_LOG_LEVEL)
 
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
 
         # Create file handler
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_handler.setLevel(getattr(logging, config.LOG_LEVEL, logging.INFO))
+        file_handler = _BatchedFileHandler(self.log_file, encoding='utf-8')
+        file_handler.setLevel(_LOG_LEVEL)
 
         # Create formatter
         formatter = logging.Formatter(
@@ -63,28 +151,41 @@ class PipelineLogger:
         # Prevent propagation to root logger
         self.logger.propagate = False
 
-    def info(self, message: str) -> None:
-        """Log an info message."""
-        self._log("info", message)
+    def info(self, message: str, *args) -> None:
+        """Log an info message, %-formatted with args when written."""
+        self._log(logging.INFO, message, args)
+
+    def warning(self, message: str, *args) -> None:
+        """Log a warning message, %-formatted with args when written."""
+        self._log(logging.WARNING, message, args)
 
-    def warning(self, message: str) -> None:
-        """Log a warning message."""
-        self._log("warning", message)
+    def error(self, message: str, *args) -> None:
+        """Log an error message, %-formatted with args when written."""
+        self._log(logging.ERROR, message, args)
 
-    def error(self, message: str) -> None:
-        """Log an error message."""
-        self._log("error", message)
+    def debug(self, message: str, *args) -> None:
+        """Log a debug message, %-formatted with args when written."""
+        self._log(logging.DEBUG, message, args)
 
-    def debug(self, message: str) -> None:
-        """Log a debug message."""
-        self._log("debug", message)
+    def _log(self, levelno: int, message: str, args: tuple = ()) -> None:
+        """
+        Internal log method; publishes the record to the writer thread.
 
-    def _log(self, level: str, message: str) -> None:
-        """Internal log method with thread safety."""
-        with _log_lock:
-            log_method = getattr(self.logger, level, None)
-            if log_method:
-                log_method(message)
+        Formatting with args is left to the writer thread, so the request
+        thread never builds the final message string.
+        """
+        if not self.logger.isEnabledFor(levelno):
+            return
+
+        # Drop the newest record rather than block when the writer falls behind
+        if len(_log_buffer) >= LOG_BUFFER_CAPACITY:
+            return
+
+        # The record is created here so its timestamp is the publish time
+        record = self.logger.makeRecord(self.logger.name, levelno, "(unknown file)", 0, message, args, None)
+        _log_buffer.append((self.logger, record))
+        _ensure_log_writer()
+        _log_ready.set()
 
     def log_event(self, event_type: str, description: str, metadata: dict = None) -> None:
         """
@@ -95,23 +196,34 @@ class PipelineLogger:
             description: Human-readable description
             metadata: Optional additional data
         """
-        metadata_str = f" | {metadata}" if metadata else ""
-        self.info(f"[{event_type}] {description}{metadata_str}")
+        if metadata:
+            self._log(logging.INFO, "[%s] %s | %s", (event_type, description, metadata))
+        else:
+            self._log(logging.INFO, "[%s] %s", (event_type, description))
 
 
 def get_logger(pipeline_id: str) -> PipelineLogger:
     """
     Get or create a logger for a pipeline.
 
+    Cached loggers are returned without locking; creation is serialized so
+    concurrent first calls don't attach two file handlers to the same log.
+
     Args:
         pipeline_id: The pipeline UUID
 
     Returns:
         PipelineLogger instance for the pipeline
     """
-    if pipeline_id not in _loggers:
-        _loggers[pipeline_id] = PipelineLogger(pipeline_id)
-    return _loggers[pipeline_id]
+    try:
+        return _loggers[pipeline_id]
+    except KeyError:
+        pass
+
+    with _loggers_lock:
+        if pipeline_id not in _loggers:
+            _loggers[pipeline_id] = PipelineLogger(pipeline_id)
+        return _loggers[pipeline_id]
 
 
 def log_pipeline_event(pipeline_id: str, event_type: str, description: str, metadata: dict = None) -> None: